@@ -68,6 +68,28 @@ def filter_2d(
     return jnp.squeeze(x, (0, 1))
 
 
+# separable kernels with at most this many taps are applied as a single 2D
+# filter, as one pass over the image is faster than two for small kernels.
+MAX_FUSED_SEPARABLE_SIZE = 25
+
+
+def separable_filter_2d(
+    image: HWArray,
+    kernel_y: jax.Array,
+    kernel_x: jax.Array,
+) -> HWArray:
+    """Filtering with a separable kernel given its vertical and horizontal parts.
+
+    Args:
+        image: 2D input array. shape is ``(height, width)``.
+        kernel_y: vertical kernel. shape is ``(kernel_height,)``.
+        kernel_x: horizontal kernel. shape is ``(kernel_width,)``.
+    """
+    if kernel_y.size * kernel_x.size <= MAX_FUSED_SEPARABLE_SIZE:
+        return filter_2d(image, jnp.outer(kernel_y, kernel_x))
+    return filter_2d(filter_2d(image, kernel_x[None]), kernel_y[:, None])
+
+
 def fft_filter_2d(
     image: HWArray,
     weight: HWArray,
@@ -136,9 +158,9 @@ def avg_blur_2d(
     """
     dtype = dtype or image.dtype
     (ky, kx) = kernel_size
-    kernel_x = calculate_average_kernel_1d(kx, dtype)[None]  # (1, kx)
-    kernel_y = calculate_average_kernel_1d(ky, dtype)[None]  # (1, ky)
-    return filter_2d(filter_2d(image, kernel_x), kernel_y.T)
+    kernel_x = calculate_average_kernel_1d(kx, dtype)  # (kx,)
+    kernel_y = calculate_average_kernel_1d(ky, dtype)  # (ky,)
+    return separable_filter_2d(image, kernel_y, kernel_x)
 
 
 def fft_avg_blur_2d(
@@ -203,9 +225,9 @@ def gaussian_blur_2d(
     """
     dtype = dtype or image.dtype
     (ky, kx), (sy, sx) = kernel_size, sigma
-    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)[None]
-    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)[None]
-    return filter_2d(filter_2d(image, gy), gx.T)
+    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)
+    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)
+    return separable_filter_2d(image, gy, gx)
 
 
 def fft_gaussian_blur_2d(
@@ -225,9 +247,9 @@ def fft_gaussian_blur_2d(
     """
     dtype = dtype or image.dtype
     (ky, kx), (sy, sx) = kernel_size, sigma
-    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)[None]
-    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)[None]
-    return fft_filter_2d(fft_filter_2d(image, gy), gx.T)
+    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)[:, None]  # (ky, 1)
+    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)[None]  # (1, kx)
+    return fft_filter_2d(fft_filter_2d(image, gx), gy)
 
 
 def unsharp_mask_2d(
@@ -250,9 +272,9 @@ def unsharp_mask_2d(
     """
     dtype = dtype or image.dtype
     (ky, kx), (sy, sx) = kernel_size, sigma
-    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)[None]
-    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)[None]
-    blur = filter_2d(filter_2d(image, gy), gx.T)
+    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)
+    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)
+    blur = separable_filter_2d(image, gy, gx)
     return image + (image - blur)
 
 
@@ -276,9 +298,9 @@ def fft_unsharp_mask_2d(
     """
     dtype = dtype or image.dtype
     (ky, kx), (sy, sx) = kernel_size, sigma
-    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)[None]
-    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)[None]
-    blur = fft_filter_2d(fft_filter_2d(image, gy), gx.T)
+    gy = calculate_gaussian_kernel_1d(ky, sy, dtype)[:, None]  # (ky, 1)
+    gx = calculate_gaussian_kernel_1d(kx, sx, dtype)[None]  # (1, kx)
+    blur = fft_filter_2d(fft_filter_2d(image, gx), gy)
     return image + (image - blur)
 
 
@@ -315,9 +337,9 @@ def box_blur_2d(
     """
     dtype = dtype or image.dtype
     (ky, kx) = kernel_size
-    kernel_x = calculate_box_kernel_1d(kx, dtype)[None]
-    kernel_y = calculate_box_kernel_1d(ky, dtype)[None]
-    return filter_2d(filter_2d(image, kernel_x), kernel_y.T)
+    kernel_x = calculate_box_kernel_1d(kx, dtype)
+    kernel_y = calculate_box_kernel_1d(ky, dtype)
+    return separable_filter_2d(image, kernel_y, kernel_x)
 
 
 def fft_box_blur_2d(
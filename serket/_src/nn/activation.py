@@ -75,7 +75,7 @@ class GLU(TreeClass):
 
 def hard_shrink(input: jax.typing.ArrayLike, alpha: float = 0.5) -> jax.Array:
     """Hard shrink activation function"""
-    return jnp.where(input > alpha, input, jnp.where(input < -alpha, input, 0.0))
+    return jnp.where(jnp.abs(input) > alpha, input, 0.0)
 
 
 @autoinit
@@ -190,11 +190,9 @@ class SoftSign(TreeClass):
 
 def softshrink(input: jax.typing.ArrayLike, alpha: float = 0.5) -> jax.Array:
     """Soft shrink activation function"""
-    return jnp.where(
-        input < -alpha,
-        input + alpha,
-        jnp.where(input > alpha, input - alpha, 0.0),
-    )
+    # x - clip(x, -alpha, alpha) equals x + alpha below -alpha, x - alpha above
+    # alpha and zero in between, without nested selects
+    return input - jnp.clip(input, -alpha, alpha)
 
 
 @autoinit
@@ -286,7 +284,7 @@ class Mish(TreeClass):
 
 def prelu(input: jax.typing.ArrayLike, a: float = 0.25) -> jax.Array:
     """Parametric ReLU activation function"""
-    return jnp.where(input >= 0, input, input * a)
+    return jax.nn.leaky_relu(input, negative_slope=a)
 
 
 @autoinit
@@ -341,7 +339,9 @@ def resolve_act(act):
         return act
     if isinstance(act, str):
         try:
-            return jax.tree_util.tree_map(lambda x: x, act_map[act])
+            # activations in ``act_map`` are stateless functions, so they can
+            # be shared without copying
+            return act_map[act]
         except KeyError:
             raise ValueError(f"Unknown {act=}, available activations: {list(act_map)}")
     raise TypeError(f"Unknown activation type {type(act)}.")
@@ -24,21 +24,17 @@ from typing_extensions import Annotated
 
 from serket import TreeClass
 from serket._src.nn.dropout import Dropout
-from serket._src.nn.linear import Linear
+from serket._src.nn.linear import Linear, is_plain_linear, linear
 from serket._src.utils.lazy import maybe_lazy_call, maybe_lazy_init
 from serket._src.utils.typing import DType, InitType
 
 """Defines attention layers."""
 
 
-def split_heads(input: jax.Array, num_heads: int) -> jax.Array:
-    """Splits the last dimension of the input into multiple heads."""
-    return input.reshape(*input.shape[:-1], num_heads, -1)
-
-
-def merge_heads(input: jax.Array) -> jax.Array:
-    """Merges the last two dimensions of the input."""
-    return input.reshape(*input.shape[:-2], -1)
+@ft.lru_cache(maxsize=8)
+def dtype_min(dtype: DType) -> float:
+    """Returns the smallest finite value of a floating ``dtype``."""
+    return float(jnp.finfo(dtype).min)
 
 
 def is_lazy_call(instance, *_, **__) -> bool:
@@ -49,20 +45,102 @@ def is_lazy_init(_, num_heads, q_features, *__, **___) -> bool:
     return q_features is None
 
 
+def infer_q_features(_1, q_input, *_2, **_3) -> int:
+    return q_input.shape[-1]
+
+
+def infer_k_features(_1, _2, k_input, *_3, **_4) -> int:
+    return k_input.shape[-1]
+
+
+def infer_v_features(_1, _2, _3, v_input, *_4, **_5) -> int:
+    return v_input.shape[-1]
+
+
 attention_updates = dict(
-    q_features=lambda _1, q_input, *_2, **_3: q_input.shape[-1],
-    k_features=lambda _1, _2, k_input, *_3, **_4: k_input.shape[-1],
-    v_features=lambda _1, _2, _3, v_input, *_4, **__5: v_input.shape[-1],
+    q_features=infer_q_features,
+    k_features=infer_k_features,
+    v_features=infer_v_features,
 )
 
 
+def is_inactive_dropout(dropout, key: jax.Array | None) -> bool:
+    # skip the dropout pass (and the random mask) when no key is given or the
+    # drop rate is a concrete zero. the raw field is read because attribute
+    # access applies ``stop_gradient`` and returns a tracer under ``jax.jit``.
+    drop_rate = vars(dropout).get("drop_rate")
+    return key is None or (isinstance(drop_rate, float) and drop_rate == 0.0)
+
+
+def project_heads(input: jax.Array, layer: Linear, num_heads: int) -> jax.Array:
+    """Applies ``layer`` and outputs ``[..., length, num_heads, head_features]``."""
+    if not is_plain_linear(layer):
+        output = layer(input)
+        return output.reshape(*output.shape[:-1], num_heads, -1)
+    # view the [out, in] weight as [num_heads, head_features, in] to project
+    # directly into the heads layout instead of reshaping the projection output
+    weight = layer.weight.reshape(num_heads, -1, layer.weight.shape[-1])
+    bias = None if layer.bias is None else layer.bias.reshape(num_heads, -1)
+    return linear(input, weight, bias, in_axis=(-1,), out_axis=(-2, -1))
+
+
+def merge_project_heads(input: jax.Array, layer: Linear, num_heads: int) -> jax.Array:
+    """Applies ``layer`` to ``[..., length, num_heads, head_features]`` input."""
+    if not is_plain_linear(layer):
+        return layer(input.reshape(*input.shape[:-2], -1))
+    # view the [out, in] weight as [out, num_heads, head_features] to contract
+    # both heads axes at once instead of merging the heads before the projection
+    weight = layer.weight.reshape(layer.weight.shape[0], num_heads, -1)
+    return linear(input, weight, layer.bias, in_axis=(-2, -1), out_axis=(-1,))
+
+
+def is_fusable(q_heads: jax.Array, k_heads: jax.Array, v_heads: jax.Array) -> bool:
+    # ``jax.nn.dot_product_attention`` is available in newer jax versions and
+    # requires matching dtypes and batch dimensions for query, key and value,
+    # and the same head size for key and value.
+    return (
+        hasattr(jax.nn, "dot_product_attention")
+        and q_heads.dtype == k_heads.dtype == v_heads.dtype
+        and q_heads.shape[:-3] == k_heads.shape[:-3] == v_heads.shape[:-3]
+        and k_heads.shape == v_heads.shape
+    )
+
+
+def fused_dot_product_attention(
+    q_heads: Annotated[jax.Array, "..., q_length, num_heads, head_features"],
+    k_heads: Annotated[jax.Array, "..., kv_length, num_heads, head_features"],
+    v_heads: Annotated[jax.Array, "..., kv_length, num_heads, head_features"],
+    mask: Annotated[jax.Array, "..., num_heads, q_length, kv_length"] | None,
+) -> Annotated[jax.Array, "..., q_length, num_heads, head_features"]:
+    """Scaled dot-product attention using ``jax.nn.dot_product_attention``.
+
+    Lets ``jax`` pick a fused (e.g. cuDNN flash attention) kernel that does not
+    materialize the ``[..., num_heads, q_length, kv_length]`` logits.
+    """
+    *batch_shape, q_length, num_heads, head_features = q_heads.shape
+    kv_length = k_heads.shape[-3]
+    # fold the leading dimensions into a single batch dimension
+    # [..., length, num_heads, head_features] -> [batch, length, ...]
+    q_heads = q_heads.reshape(-1, q_length, num_heads, head_features)
+    k_heads = k_heads.reshape(-1, kv_length, num_heads, head_features)
+    v_heads = v_heads.reshape(-1, kv_length, num_heads, head_features)
+
+    if mask is not None:
+        mask_shape = (*batch_shape, num_heads, q_length, kv_length)
+        mask = jnp.broadcast_to(mask, mask_shape).astype(bool)
+        mask = mask.reshape(-1, num_heads, q_length, kv_length)
+
+    attention = jax.nn.dot_product_attention(q_heads, k_heads, v_heads, mask=mask)
+    return attention.reshape(*batch_shape, *attention.shape[1:])
+
+
 def dot_product_attention(
     q_heads: Annotated[jax.Array, "..., q_length, num_heads, head_features"],
     k_heads: Annotated[jax.Array, "..., kv_length, num_heads, head_features"],
     v_heads: Annotated[jax.Array, "..., kv_length, num_heads, head_features"],
     mask: Annotated[jax.Array, "..., num_heads, q_length, kv_length"] | None,
     drop_func: Callable[[jax.Array], jax.Array],
-) -> jax.Array:
+) -> Annotated[jax.Array, "..., q_length, num_heads, head_features"]:
     """Applies multi-head attention to the given inputs.
 
     Args:
@@ -78,15 +156,26 @@ def dot_product_attention(
         - https://keras.io/api/layers/attention_layers/multi_head_attention/
         - https://flax.readthedocs.io/en/latest/_modules/flax/linen/attention.html
     """
-    *_other, _length, _num_heads, k_depth = k_heads.shape
-    logits = jnp.einsum("...qhd,...khd->...hqk", q_heads, k_heads)
-    logits /= jnp.sqrt(k_depth)
-    min_num = jnp.finfo(logits.dtype).min
-    logits = logits if mask is None else jnp.where(mask, logits, min_num)
-    weight = jax.nn.softmax(logits)
-    attention = jnp.einsum("...hqk,...khd->...qhd", weight, v_heads)
+    if is_fusable(q_heads, k_heads, v_heads):
+        attention = fused_dot_product_attention(q_heads, k_heads, v_heads, mask)
+    else:
+        *_other, _length, _num_heads, k_depth = k_heads.shape
+        # scale the [..., q_length, num_heads, head_features] queries instead
+        # of the (larger) [..., num_heads, q_length, kv_length] logits, the
+        # weakly typed python scalar keeps the query dtype
+        logits = jnp.einsum("...qhd,...khd->...hqk", q_heads * k_depth**-0.5, k_heads)
+        # accumulate the softmax in at least float32 for low precision inputs
+        logits = logits.astype(jnp.promote_types(logits.dtype, jnp.float32))
+        if mask is not None:
+            # additive mask bias folds into the softmax fusion. it is added after
+            # the promotion so low precision logits do not overflow to ``-inf``
+            logits = logits + jnp.where(mask, 0.0, dtype_min(logits.dtype))
+        weight = jax.nn.softmax(logits).astype(v_heads.dtype)
+        attention = jnp.einsum("...hqk,...khd->...qhd", weight, v_heads)
     # avoid using Dropout layers inside functions
-    return merge_heads(drop_func(attention))
+    # dropout is applied on the attention output (not the attention weights)
+    # so it does not prevent using the fused kernel.
+    return drop_func(attention)
 
 
 class MultiHeadAttention(TreeClass):
@@ -125,6 +214,10 @@ class MultiHeadAttention(TreeClass):
         drop_rate: Dropout rate. defaults to 0.0.
         drop_broadcast: Whether to broadcast the dropout mask across the batch
             dimension and the heads dimension. Defaults to False.
+        compute_dtype: Data type used for the attention matmuls, e.g.
+            ``jnp.bfloat16`` for mixed precision. The softmax is computed in
+            ``float32`` and the result is cast back to the projection dtype.
+            Defaults to ``None`` to use the projection dtype.
 
     Example:
         >>> import serket as sk
@@ -216,6 +309,7 @@ class MultiHeadAttention(TreeClass):
         out_dtype: DType = jnp.float32,
         drop_rate: float = 0.0,
         drop_broadcast: bool = False,
+        compute_dtype: DType | None = None,
     ):
         k_features = q_features if k_features is None else k_features
         v_features = q_features if v_features is None else v_features
@@ -237,6 +331,7 @@ class MultiHeadAttention(TreeClass):
         qkey, kkey, vkey, okey = jr.split(key, 4)
 
         self.num_heads = num_heads
+        self.compute_dtype = compute_dtype
         # while dropout == 0.0 is a no-op, still instantiate a dropout layer
         # because .at[drop_rate] can be used to change the dropout rate later on.
         self.dropout = Dropout(drop_rate, (-1, -2) if drop_broadcast else None)
@@ -299,27 +394,39 @@ class MultiHeadAttention(TreeClass):
                 Defaults to ``None`` for no dropout.
         """
 
-        # [..., q_length, q_features] -> [..., q_length, head_features, num_heads]
-        q_heads = split_heads(self.q_projection(q_input), self.num_heads)
-        # [..., k_length, k_features] -> [..., k_length, head_features, num_heads]
-        k_heads = split_heads(self.k_projection(k_input), self.num_heads)
-        # [..., v_length, v_features] -> [..., v_length, head_features, num_heads]
-        v_heads = split_heads(self.v_projection(v_input), self.num_heads)
+        # [..., length, features] -> [..., length, num_heads, head_features]
+        q_heads = project_heads(q_input, self.q_projection, self.num_heads)
+        k_heads = project_heads(k_input, self.k_projection, self.num_heads)
+        v_heads = project_heads(v_input, self.v_projection, self.num_heads)
+
+        dtype = q_heads.dtype
+
+        if self.compute_dtype is not None:
+            q_heads = q_heads.astype(self.compute_dtype)
+            k_heads = k_heads.astype(self.compute_dtype)
+            v_heads = v_heads.astype(self.compute_dtype)
+
+        # note that if `tree_eval` is used, self.dropout is converted to an
+        # identity function, so the `key` argument is ignored.
+        # one pro of this approach is that `Identity` will be displayed in
+        # the repr of the layer to make it clear that dropout is disabled.
+        # another pro is that no need to thread the ``training`` flag through
+        # the layer.
+        drop_func = (
+            (lambda input: input)
+            if is_inactive_dropout(self.dropout, key)
+            else (lambda input: self.dropout(input, key=key))
+        )
 
         attention = self.attention_op(
             q_heads=q_heads,
             k_heads=k_heads,
             v_heads=v_heads,
             mask=mask,
-            # note that if `tree_eval` is used, self.dropout is converted to an
-            # identity function, so the `key` argument is ignored.
-            # one pro of this approach is that `Identity` will be displayed in
-            # the repr of the layer to make it clear that dropout is disabled.
-            # another pro is that no need to thread the ``training`` flag through
-            # the layer.
-            drop_func=lambda input: self.dropout(input, key=key),
+            drop_func=drop_func,
         )
 
-        return self.out_projection(attention)
+        attention = attention.astype(dtype)
+        return merge_project_heads(attention, self.out_projection, self.num_heads)
 
     attention_op = staticmethod(dot_product_attention)
@@ -2339,7 +2339,7 @@ class SeparableConvND(TreeClass):
         kernel_size = canonicalize(1, self.spatial_ndim)
         weight_shape = (out_features, depth_multiplier * in_features, *kernel_size)
         args = (key, weight_shape, dtype)
-        self.pointwise_weight = resolve_init(self.pointwise_bias_init)(*args)
+        self.pointwise_weight = resolve_init(self.pointwise_weight_init)(*args)
         bias_shape = (out_features, *(1,) * self.spatial_ndim)
         args = (key, bias_shape, dtype)
         self.pointwise_bias = resolve_init(self.pointwise_bias_init)(*args)
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import abc
 import functools as ft
+import math
 from itertools import chain
 
 import jax
@@ -26,7 +27,6 @@ from serket import TreeClass, autoinit, field
 from serket._src.custom_transform import tree_eval
 from serket._src.nn.linear import Identity
 from serket._src.utils.convert import canonicalize
-from serket._src.utils.mapping import kernel_map
 from serket._src.utils.validate import (
     IsInstance,
     Range,
@@ -78,34 +78,21 @@ def random_cutout_nd(
         cutout_count: number of holes.
         fill_value: fill_value to fill.
     """
-    start_indices = [0] * len(shape)
-    slice_sizes = [di - (di % ki) for di, ki in zip(input.shape, shape)]
-    valid_array = jax.lax.dynamic_slice(input, start_indices, slice_sizes)
-
-    @ft.partial(
-        kernel_map,
-        shape=input.shape,
-        kernel_size=shape,
-        strides=shape,
-        padding=((0, 0),) * len(shape),
-    )
-    def generate_patches(input):
-        return input
-
-    # get non-overlapping patches
-    patches = generate_patches(input)
-    patches_shape = patches.shape
-
-    # patches_shape = (patch_0, ..., patch_n, k0, ..., kn)
-    patches = patches.reshape(-1, *shape)
-    indices = jr.choice(key, patches.shape[0], shape=(cutout_count,), replace=False)
-    patches = patches.at[indices].set(fill_value).reshape(patches_shape)
-    # patches_shape = (patch_0, k0, ..., patch_n, kn)
-    patch_axes = range(len(shape))
-    kernel_axes = range(len(shape), len(shape) * 2)
-    transpose_axes = list(chain.from_iterable(zip(patch_axes, kernel_axes)))
-    depatched = patches.transpose(transpose_axes).reshape(valid_array.shape)
-    return jax.lax.dynamic_update_slice(input, depatched, start_indices)
+    # select ``cutout_count`` cells of the grid of non-overlapping patches
+    grid_shape = [di // ki for di, ki in zip(input.shape, shape)]
+    indices = jr.choice(key, math.prod(grid_shape), (cutout_count,), replace=False)
+    grid = jnp.zeros(math.prod(grid_shape), dtype=bool).at[indices].set(True)
+    # expand each grid cell to its patch: (patch_0, 1, ..., patch_n, 1)
+    # -> (patch_0, k0, ..., patch_n, kn) -> (patch_0 * k0, ..., patch_n * kn)
+    grid = grid.reshape(list(chain.from_iterable((gi, 1) for gi in grid_shape)))
+    mask_shape = list(chain.from_iterable(zip(grid_shape, shape)))
+    mask_size = [gi * ki for gi, ki in zip(grid_shape, shape)]
+    mask = jnp.broadcast_to(grid, mask_shape).reshape(mask_size)
+    # the trailing remainder that does not fit a whole patch is never cut out
+    mask = jnp.pad(mask, [(0, di - mi) for di, mi in zip(input.shape, mask_size)])
+    # mask the patches in a single pass instead of extracting them
+    fill_value = jnp.asarray(fill_value).astype(input.dtype)
+    return jnp.where(mask, fill_value, input)
 
 
 @autoinit
@@ -23,6 +23,13 @@ import jax.tree_util as jtu
 
 from serket._src.utils.typing import InitFuncType, InitLiteral, InitType
 
+
+def orthogonal(key: jax.Array, shape, dtype=jnp.float32) -> jax.Array:
+    # qr is only implemented for single and double precision
+    compute_dtype = jnp.promote_types(dtype, jnp.float32)
+    return ji.orthogonal()(key, shape, compute_dtype).astype(dtype)
+
+
 inits: list[InitType] = [
     ji.he_normal(in_axis=1, out_axis=0),
     ji.he_uniform(in_axis=1, out_axis=0),
@@ -36,7 +43,7 @@ inits: list[InitType] = [
     ji.zeros,
     ji.xavier_normal(in_axis=1, out_axis=0),
     ji.xavier_uniform(in_axis=1, out_axis=0),
-    ji.orthogonal(),
+    orthogonal,
 ]
 
 
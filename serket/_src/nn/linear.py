@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import functools as ft
 import math
-from typing import Sequence
+from typing import Any, Sequence
 
 import jax
 import jax.numpy as jnp
@@ -35,14 +35,16 @@ from serket._src.utils.typing import Batched, DType, InitType
 from serket._src.utils.validate import validate_pos_int
 
 
+@ft.lru_cache(maxsize=128)
 def generate_einsum_pattern(
     lhs_ndim: int,
     rhs_ndim: int,
-    in_axis: Sequence[int],
-    out_axis: Sequence[int],
+    in_axis: tuple[int, ...],
+    out_axis: tuple[int, ...],
 ) -> tuple[str, str, str]:
     # helper function to generate the einsum pattern for linear layer
-    # with flexible input and output axes
+    # with flexible input and output axes. cached as the pattern only
+    # depends on the (hashable) ranks and axes.
     lhs_alpha = "abcdefghijklmnopqrstuvwxyz"
     rhs_alpha = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
     assert (len(in_axis) + len(out_axis)) == rhs_ndim
@@ -77,6 +79,16 @@ def linear(
         in_axis: axes to apply the linear layer to.
         out_axis: result axis.
     """
+    in_axis, out_axis = tuple(in_axis), tuple(out_axis)
+
+    if weight.ndim == 2 and {in_axis, out_axis} <= {(-1,), (input.ndim - 1,)}:
+        # plain matmul over the last axis: [..., in] x [out, in] -> [..., out]
+        dtype = jnp.result_type(input, weight)
+        dimension_numbers = (((input.ndim - 1,), (1,)), ((), ()))
+        input, weight = input.astype(dtype), weight.astype(dtype)
+        result = jax.lax.dot_general(input, weight, dimension_numbers)
+        return result if bias is None else result + bias
+
     lhs, rhs, out = generate_einsum_pattern(input.ndim, weight.ndim, in_axis, out_axis)
     result = jnp.einsum(f"{lhs},{rhs}->{out}", input, weight)
 
@@ -234,6 +246,12 @@ class Linear(sk.TreeClass):
     linear_op = staticmethod(linear)
 
 
+
+def is_plain_linear(layer: Any) -> bool:
+    # fast paths that view the weight directly only apply to a ``Linear`` over
+    # the last axis without an overridden ``__call__``
+    return type(layer) is Linear and layer.in_axis == layer.out_axis == (-1,)
+
 class Identity(sk.TreeClass):
     """Identity layer. Returns the input."""
 
@@ -248,6 +266,9 @@ class Embedding(sk.TreeClass):
         in_features: vocabulary size.
         out_features: embedding size.
         key: random key to initialize the weight.
+        dtype: dtype of the embedding table. ``float32``. Use a lower precision
+            dtype (e.g. ``jnp.bfloat16``) to reduce the memory and bandwidth
+            of the lookup for large vocabularies.
 
     Example:
         >>> import jax.numpy as jnp
@@ -263,10 +284,17 @@ class Embedding(sk.TreeClass):
         (1, 3)
     """
 
-    def __init__(self, in_features: int, out_features: int, key: jax.Array):
+    def __init__(
+        self,
+        in_features: int,
+        out_features: int,
+        key: jax.Array,
+        dtype: DType = jnp.float32,
+    ):
         self.in_features = validate_pos_int(in_features)
         self.out_features = validate_pos_int(out_features)
-        self.weight = jr.normal(key, (self.out_features, self.in_features))
+        weight_shape = (self.out_features, self.in_features)
+        self.weight = jr.normal(key, weight_shape).astype(dtype)
 
     def __call__(self, input: jax.Array) -> jax.Array:
         """Embeds the input.
@@ -299,12 +327,13 @@ def scan_linear(
         output, _ = jax.lax.scan(scan_func, input, weight)
         return output
 
-    def scan_func(input: jax.Array, weight_bias: Batched[jax.Array]):
-        weight, bias = weight_bias[..., :-1], weight_bias[..., -1]
+    def scan_func(input: jax.Array, weight_bias: tuple[jax.Array, jax.Array]):
+        weight, bias = weight_bias
         return act(linear(input, weight, bias)), None
 
-    weight_bias = jnp.concatenate([weight, bias[:, :, None]], axis=-1)
-    output, _ = jax.lax.scan(scan_func, input, weight_bias)
+    # scan over the (weight, bias) pair directly to avoid copying
+    # all the intermediate weights into a concatenated array on every call
+    output, _ = jax.lax.scan(scan_func, input, (weight, bias))
     return output
 
 
@@ -34,17 +34,26 @@ from serket._src.nn.convolution import (
     FFTConv1D,
     FFTConv2D,
     FFTConv3D,
+    SeparableConv1D,
+    SeparableConv2D,
+    SeparableConv3D,
+    SeparableFFTConv1D,
+    SeparableFFTConv2D,
+    SeparableFFTConv3D,
 )
-from serket._src.nn.linear import Linear
+from serket._src.nn.linear import Linear, is_plain_linear, linear
+from serket._src.utils.convert import canonicalize
 from serket._src.utils.lazy import maybe_lazy_call, maybe_lazy_init
 from serket._src.utils.typing import (
     DilationType,
     DType,
     InitType,
     KernelSizeType,
+    P,
     PaddingType,
     S,
     StridesType,
+    T,
 )
 from serket._src.utils.validate import (
     validate_in_features_shape,
@@ -68,6 +77,88 @@ def infer_in_features(_, input: jax.Array, *_1, **_2) -> int:
 updates = dict(in_features=infer_in_features)
 
 
+def infer_sequence_in_features(_, input: jax.Array, *_1, **_2) -> int:
+    return input.shape[1]
+
+
+sequence_updates = dict(in_features=infer_sequence_in_features)
+
+
+def gate_view(input: jax.Array, num_gates: int) -> jax.Array:
+    # view the gate axis as (num_gates, features, ...) for split-free indexing
+    return input.reshape(num_gates, -1, *input.shape[1:])
+
+
+def lstm_update(
+    gates: jax.Array,
+    cell_state: jax.Array,
+    act: Callable[[jax.Array], jax.Array],
+    recurrent_act: Callable[[jax.Array], jax.Array],
+) -> tuple[jax.Array, jax.Array]:
+    """LSTM pointwise update from the summed input and recurrent projections."""
+    i, f, g, o = gate_view(gates, 4)
+    i = recurrent_act(i)
+    f = recurrent_act(f)
+    g = act(g)
+    o = recurrent_act(o)
+    cell_state = f * cell_state + i * g
+    return o * act(cell_state), cell_state
+
+
+def gru_update(
+    input_gates: jax.Array,
+    hidden_gates: jax.Array,
+    hidden_state: jax.Array,
+    act: Callable[[jax.Array], jax.Array],
+    recurrent_act: Callable[[jax.Array], jax.Array],
+) -> jax.Array:
+    """GRU pointwise update from the input and recurrent projections."""
+    x = gate_view(input_gates, 3)
+    hh = gate_view(hidden_gates, 3)
+    # the reset and update gates share one add and one activation
+    e, u = recurrent_act(x[:2] + hh[:2])
+    o = act(x[2] + (e * hh[2]))
+    return u * (hidden_state - o) + o
+
+
+def validate_sequence_ndim(func: Callable[P, T]) -> Callable[P, T]:
+    """Decorator to validate a ``(time, in_features, *spatial)`` sequence input."""
+
+    @ft.wraps(func)
+    def wrapper(self, input, *a, **k):
+        if input.ndim != (spatial_ndim := self.spatial_ndim) + 2:
+            shape = ", ".join(["time", "in_features", *["..."] * spatial_ndim])
+            raise ValueError(f"Expected shape ({shape}), got {input.shape=}")
+        return func(self, input, *a, **k)
+
+    return wrapper
+
+
+def has_unroll(cell: Any) -> bool:
+    # cells that override ``__call__`` without ``unroll`` are scanned step by
+    # step to respect the override
+    for klass in type(cell).__mro__:
+        if "__call__" in vars(klass):
+            return "unroll" in vars(klass)
+    return False
+
+
+def scan_steps(
+    cell: Any,
+    input: jax.Array,
+    state: S,
+    reverse: bool,
+) -> tuple[jax.Array, S]:
+    """Scan ``cell`` step by step over the leading axis of ``input``."""
+
+    def step(state: S, input: jax.Array) -> tuple[S, jax.Array]:
+        output, state = cell(input, state)
+        return state, output
+
+    state, output = jax.lax.scan(step, state, input, reverse=reverse)
+    return output, state
+
+
 @autoinit
 class RNNState(TreeClass):
     hidden_state: jax.Array
@@ -189,6 +280,56 @@ class SimpleRNNCell(TreeClass):
         h = self.act(h)
         return h, SimpleRNNState(h)
 
+    @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=sequence_updates)
+    @validate_sequence_ndim
+    @ft.partial(validate_in_features_shape, axis=1)
+    def unroll(
+        self,
+        input: jax.Array,
+        state: SimpleRNNState,
+        reverse: bool = False,
+    ) -> tuple[jax.Array, SimpleRNNState]:
+        """Run the cell over a ``(time, in_features)`` sequence.
+
+        The input projection of all time steps is computed in a single matrix
+        multiplication before the scan, leaving only the recurrent projection
+        inside the loop body.
+
+        Args:
+            input: the input sequence with shape ``(time, in_features)``.
+            state: the initial state of the cell.
+            reverse: whether to scan the sequence in reverse order.
+
+        Returns:
+            The stacked outputs with shape ``(time, hidden_features)`` and the
+            final state.
+
+        Example:
+            >>> import serket as sk
+            >>> import jax.numpy as jnp
+            >>> import jax.random as jr
+            >>> cell = sk.nn.SimpleRNNCell(10, 20, key=jr.key(0))
+            >>> output, state = cell.unroll(jnp.ones([5, 10]), sk.tree_state(cell))
+            >>> output.shape
+            (5, 20)
+        """
+        if not isinstance(state, SimpleRNNState):
+            raise TypeError(f"Expected {state=} to be an instance of `SimpleRNNState`")
+
+        layer = self.in_hidden_to_hidden
+        if not is_plain_linear(layer):
+            # a replaced projection can not be split, step through ``__call__``
+            return scan_steps(self, input, state, reverse)
+        w_ih, w_hh = jnp.split(layer.weight, [self.in_features], axis=-1)
+        ih = linear(input, w_ih, layer.bias)
+
+        def step(state: SimpleRNNState, ih: jax.Array):
+            h = self.act(ih + linear(state.hidden_state, w_hh, None))
+            return SimpleRNNState(h), h
+
+        state, output = jax.lax.scan(step, state, ih, reverse=reverse)
+        return output, state
+
     spatial_ndim: int = 0
 
 
@@ -402,19 +543,62 @@ class LSTMCell(TreeClass):
         if not isinstance(state, LSTMState):
             raise TypeError(f"Expected {state=} to be an instance of `LSTMState`")
 
-        h, c = state.hidden_state, state.cell_state
-        ih = jnp.concatenate([input, h], axis=-1)
-        h = self.in_hidden_to_hidden(ih)
-
-        i, f, g, o = jnp.split(h, 4)
-        i = self.recurrent_act(i)
-        f = self.recurrent_act(f)
-        g = self.act(g)
-        o = self.recurrent_act(o)
-        c = f * c + i * g
-        h = o * self.act(c)
+        ih = jnp.concatenate([input, state.hidden_state], axis=-1)
+        gates = self.in_hidden_to_hidden(ih)
+        h, c = lstm_update(gates, state.cell_state, self.act, self.recurrent_act)
         return h, LSTMState(h, c)
 
+    @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=sequence_updates)
+    @validate_sequence_ndim
+    @ft.partial(validate_in_features_shape, axis=1)
+    def unroll(
+        self,
+        input: jax.Array,
+        state: LSTMState,
+        reverse: bool = False,
+    ) -> tuple[jax.Array, LSTMState]:
+        """Run the cell over a ``(time, in_features)`` sequence.
+
+        The input projection of all time steps is computed in a single matrix
+        multiplication before the scan, leaving only the recurrent projection
+        inside the loop body.
+
+        Args:
+            input: the input sequence with shape ``(time, in_features)``.
+            state: the initial state of the cell.
+            reverse: whether to scan the sequence in reverse order.
+
+        Returns:
+            The stacked outputs with shape ``(time, hidden_features)`` and the
+            final state.
+
+        Example:
+            >>> import serket as sk
+            >>> import jax.numpy as jnp
+            >>> import jax.random as jr
+            >>> cell = sk.nn.LSTMCell(10, 20, key=jr.key(0))
+            >>> output, state = cell.unroll(jnp.ones([5, 10]), sk.tree_state(cell))
+            >>> output.shape
+            (5, 20)
+        """
+        if not isinstance(state, LSTMState):
+            raise TypeError(f"Expected {state=} to be an instance of `LSTMState`")
+
+        layer = self.in_hidden_to_hidden
+        if not is_plain_linear(layer):
+            # a replaced projection can not be split, step through ``__call__``
+            return scan_steps(self, input, state, reverse)
+        w_ih, w_hh = jnp.split(layer.weight, [self.in_features], axis=-1)
+        ih = linear(input, w_ih, layer.bias)
+
+        def step(state: LSTMState, ih: jax.Array):
+            gates = ih + linear(state.hidden_state, w_hh, None)
+            h, c = lstm_update(gates, state.cell_state, self.act, self.recurrent_act)
+            return LSTMState(h, c), h
+
+        state, output = jax.lax.scan(step, state, ih, reverse=reverse)
+        return output, state
+
     spatial_ndim: int = 0
 
 
@@ -525,14 +709,58 @@ class GRUCell(TreeClass):
             raise TypeError(f"Expected {state=} to be an instance of `GRUState`")
 
         h = state.hidden_state
-        xe, xu, xo = jnp.split(self.in_to_hidden(input), 3)
-        he, hu, ho = jnp.split(self.hidden_to_hidden(h), 3)
-        e = self.recurrent_act(xe + he)
-        u = self.recurrent_act(xu + hu)
-        o = self.act(xo + (e * ho))
-        h = (1 - u) * o + u * h
+        xh, hh = self.in_to_hidden(input), self.hidden_to_hidden(h)
+        h = gru_update(xh, hh, h, self.act, self.recurrent_act)
         return h, GRUState(hidden_state=h)
 
+    @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=sequence_updates)
+    @validate_sequence_ndim
+    @ft.partial(validate_in_features_shape, axis=1)
+    def unroll(
+        self,
+        input: jax.Array,
+        state: GRUState,
+        reverse: bool = False,
+    ) -> tuple[jax.Array, GRUState]:
+        """Run the cell over a ``(time, in_features)`` sequence.
+
+        The input projection of all time steps is computed in a single matrix
+        multiplication before the scan, leaving only the recurrent projection
+        inside the loop body.
+
+        Args:
+            input: the input sequence with shape ``(time, in_features)``.
+            state: the initial state of the cell.
+            reverse: whether to scan the sequence in reverse order.
+
+        Returns:
+            The stacked outputs with shape ``(time, hidden_features)`` and the
+            final state.
+
+        Example:
+            >>> import serket as sk
+            >>> import jax.numpy as jnp
+            >>> import jax.random as jr
+            >>> cell = sk.nn.GRUCell(10, 20, key=jr.key(0))
+            >>> output, state = cell.unroll(jnp.ones([5, 10]), sk.tree_state(cell))
+            >>> output.shape
+            (5, 20)
+        """
+        if not isinstance(state, GRUState):
+            raise TypeError(f"Expected {state=} to be an instance of `GRUState`")
+
+        # vmap keeps the single step layout of the ``out_axis=0`` projection
+        ih = jax.vmap(self.in_to_hidden)(input)
+
+        def step(state: GRUState, ih: jax.Array):
+            h = state.hidden_state
+            hh = self.hidden_to_hidden(h)
+            h = gru_update(ih, hh, h, self.act, self.recurrent_act)
+            return GRUState(hidden_state=h), h
+
+        state, output = jax.lax.scan(step, state, ih, reverse=reverse)
+        return output, state
+
     spatial_ndim: int = 0
 
 
@@ -558,6 +786,7 @@ class ConvLSTMNDCell(TreeClass):
         recurrent_weight_init: InitType = "orthogonal",
         act: ActivationType | None = "tanh",
         recurrent_act: ActivationType | None = "hard_sigmoid",
+        separable: bool = False,
         dtype: DType = jnp.float32,
     ):
         k1, k2 = jr.split(key, 2)
@@ -580,18 +809,39 @@ class ConvLSTMNDCell(TreeClass):
             dtype=dtype,
         )
 
-        self.hidden_to_hidden = self.conv_layer(
-            hidden_features,
-            hidden_features * 4,
-            kernel_size,
-            strides=strides,
-            padding=padding,
-            dilation=dilation,
-            weight_init=recurrent_weight_init,
-            bias_init=None,
-            key=k2,
-            dtype=dtype,
-        )
+        if separable:
+            if self.separable_conv_layer is None:
+                name = type(self).__name__
+                raise ValueError(f"{name} does not define a `separable_conv_layer`.")
+            if set(canonicalize(dilation, self.spatial_ndim, "dilation")) != {1}:
+                raise ValueError(f"{separable=} does not support {dilation=}.")
+
+            # depthwise spatial filter followed by a pointwise projection to the gates
+            self.hidden_to_hidden = self.separable_conv_layer(
+                hidden_features,
+                hidden_features * 4,
+                kernel_size,
+                strides=strides,
+                padding=padding,
+                depthwise_weight_init=recurrent_weight_init,
+                pointwise_weight_init=recurrent_weight_init,
+                pointwise_bias_init=None,
+                key=k2,
+                dtype=dtype,
+            )
+        else:
+            self.hidden_to_hidden = self.conv_layer(
+                hidden_features,
+                hidden_features * 4,
+                kernel_size,
+                strides=strides,
+                padding=padding,
+                dilation=dilation,
+                weight_init=recurrent_weight_init,
+                bias_init=None,
+                key=k2,
+                dtype=dtype,
+            )
 
     @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=updates)
     @ft.partial(validate_spatial_ndim, argnum=0)
@@ -604,21 +854,65 @@ class ConvLSTMNDCell(TreeClass):
         if not isinstance(state, ConvLSTMNDState):
             raise TypeError(f"Expected {state=} to be an instance of ConvLSTMNDState.")
 
-        h, c = state.hidden_state, state.cell_state
-        h = self.in_to_hidden(input) + self.hidden_to_hidden(h)
-        i, f, g, o = jnp.split(h, 4, axis=0)
-        i = self.recurrent_act(i)
-        f = self.recurrent_act(f)
-        g = self.act(g)
-        o = self.recurrent_act(o)
-        c = f * c + i * g
-        h = o * self.act(c)
+        gates = self.in_to_hidden(input) + self.hidden_to_hidden(state.hidden_state)
+        h, c = lstm_update(gates, state.cell_state, self.act, self.recurrent_act)
         return h, ConvLSTMNDState(h, c)
 
+    @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=sequence_updates)
+    @validate_sequence_ndim
+    @ft.partial(validate_in_features_shape, axis=1)
+    def unroll(
+        self,
+        input: jax.Array,
+        state: ConvLSTMNDState,
+        reverse: bool = False,
+    ) -> tuple[jax.Array, ConvLSTMNDState]:
+        """Run the cell over a ``(time, in_features, *spatial)`` sequence.
+
+        The input convolution of all time steps is computed as a single batched
+        convolution before the scan, leaving only the recurrent convolution
+        inside the loop body.
+
+        Args:
+            input: the input sequence with shape ``(time, in_features, *spatial)``.
+            state: the initial state of the cell.
+            reverse: whether to scan the sequence in reverse order.
+
+        Returns:
+            The stacked outputs with shape ``(time, hidden_features, *spatial)``
+            and the final state.
+
+        Example:
+            >>> import serket as sk
+            >>> import jax.numpy as jnp
+            >>> import jax.random as jr
+            >>> cell = sk.nn.ConvLSTM1DCell(10, 2, 3, key=jr.key(0))
+            >>> input = jnp.ones([5, 10, 4])
+            >>> state = sk.tree_state(cell, input=input[0])
+            >>> output, state = cell.unroll(input, state)
+            >>> output.shape
+            (5, 2, 4)
+        """
+        if not isinstance(state, ConvLSTMNDState):
+            raise TypeError(f"Expected {state=} to be an instance of ConvLSTMNDState.")
+
+        ih = jax.vmap(self.in_to_hidden)(input)
+
+        def step(state: ConvLSTMNDState, ih: jax.Array):
+            gates = ih + self.hidden_to_hidden(state.hidden_state)
+            h, c = lstm_update(gates, state.cell_state, self.act, self.recurrent_act)
+            return ConvLSTMNDState(h, c), h
+
+        state, output = jax.lax.scan(step, state, ih, reverse=reverse)
+        return output, state
+
     @property
     @abc.abstractmethod
     def conv_layer(self): ...
 
+    # optional, only required for ``separable=True``
+    separable_conv_layer = None
+
     spatial_ndim = property(abc.abstractmethod(lambda _: ...))
 
 
@@ -638,6 +932,8 @@ class ConvLSTM1DCell(ConvLSTMNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -677,6 +973,7 @@ class ConvLSTM1DCell(ConvLSTMNDCell):
 
     spatial_ndim: int = 1
     conv_layer = Conv1D
+    separable_conv_layer = SeparableConv1D
 
 
 class FFTConvLSTM1DCell(ConvLSTMNDCell):
@@ -695,6 +992,8 @@ class FFTConvLSTM1DCell(ConvLSTMNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -734,6 +1033,7 @@ class FFTConvLSTM1DCell(ConvLSTMNDCell):
 
     spatial_ndim: int = 1
     conv_layer = FFTConv1D
+    separable_conv_layer = SeparableFFTConv1D
 
 
 class ConvLSTM2DCell(ConvLSTMNDCell):
@@ -752,6 +1052,8 @@ class ConvLSTM2DCell(ConvLSTMNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -791,6 +1093,7 @@ class ConvLSTM2DCell(ConvLSTMNDCell):
 
     spatial_ndim: int = 2
     conv_layer = Conv2D
+    separable_conv_layer = SeparableConv2D
 
 
 class FFTConvLSTM2DCell(ConvLSTMNDCell):
@@ -809,6 +1112,8 @@ class FFTConvLSTM2DCell(ConvLSTMNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -848,6 +1153,7 @@ class FFTConvLSTM2DCell(ConvLSTMNDCell):
 
     spatial_ndim: int = 2
     conv_layer = FFTConv2D
+    separable_conv_layer = SeparableFFTConv2D
 
 
 class ConvLSTM3DCell(ConvLSTMNDCell):
@@ -866,6 +1172,8 @@ class ConvLSTM3DCell(ConvLSTMNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -905,6 +1213,7 @@ class ConvLSTM3DCell(ConvLSTMNDCell):
 
     spatial_ndim: int = 3
     conv_layer = Conv3D
+    separable_conv_layer = SeparableConv3D
 
 
 class FFTConvLSTM3DCell(ConvLSTMNDCell):
@@ -923,6 +1232,8 @@ class FFTConvLSTM3DCell(ConvLSTMNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -962,6 +1273,7 @@ class FFTConvLSTM3DCell(ConvLSTMNDCell):
 
     spatial_ndim: int = 3
     conv_layer = FFTConv3D
+    separable_conv_layer = SeparableFFTConv3D
 
 
 class ConvGRUNDState(RNNState): ...
@@ -984,6 +1296,7 @@ class ConvGRUNDCell(TreeClass):
         recurrent_weight_init: InitType = "orthogonal",
         act: ActivationType | None = "tanh",
         recurrent_act: ActivationType | None = "sigmoid",
+        separable: bool = False,
         dtype: DType = jnp.float32,
     ):
         k1, k2 = jr.split(key, 2)
@@ -1006,18 +1319,39 @@ class ConvGRUNDCell(TreeClass):
             dtype=dtype,
         )
 
-        self.hidden_to_hidden = self.conv_layer(
-            hidden_features,
-            hidden_features * 3,
-            kernel_size,
-            strides=strides,
-            padding=padding,
-            dilation=dilation,
-            weight_init=recurrent_weight_init,
-            bias_init=None,
-            key=k2,
-            dtype=dtype,
-        )
+        if separable:
+            if self.separable_conv_layer is None:
+                name = type(self).__name__
+                raise ValueError(f"{name} does not define a `separable_conv_layer`.")
+            if set(canonicalize(dilation, self.spatial_ndim, "dilation")) != {1}:
+                raise ValueError(f"{separable=} does not support {dilation=}.")
+
+            # depthwise spatial filter followed by a pointwise projection to the gates
+            self.hidden_to_hidden = self.separable_conv_layer(
+                hidden_features,
+                hidden_features * 3,
+                kernel_size,
+                strides=strides,
+                padding=padding,
+                depthwise_weight_init=recurrent_weight_init,
+                pointwise_weight_init=recurrent_weight_init,
+                pointwise_bias_init=None,
+                key=k2,
+                dtype=dtype,
+            )
+        else:
+            self.hidden_to_hidden = self.conv_layer(
+                hidden_features,
+                hidden_features * 3,
+                kernel_size,
+                strides=strides,
+                padding=padding,
+                dilation=dilation,
+                weight_init=recurrent_weight_init,
+                bias_init=None,
+                key=k2,
+                dtype=dtype,
+            )
 
     @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=updates)
     @ft.partial(validate_spatial_ndim, argnum=0)
@@ -1031,18 +1365,66 @@ class ConvGRUNDCell(TreeClass):
             raise TypeError(f"Expected {state=} to be an instance of `GRUState`")
 
         h = state.hidden_state
-        xe, xu, xo = jnp.split(self.in_to_hidden(input), 3)
-        he, hu, ho = jnp.split(self.hidden_to_hidden(h), 3)
-        e = self.recurrent_act(xe + he)
-        u = self.recurrent_act(xu + hu)
-        o = self.act(xo + (e * ho))
-        h = (1 - u) * o + u * h
+        xh, hh = self.in_to_hidden(input), self.hidden_to_hidden(h)
+        h = gru_update(xh, hh, h, self.act, self.recurrent_act)
         return h, ConvGRUNDState(h)
 
+    @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=sequence_updates)
+    @validate_sequence_ndim
+    @ft.partial(validate_in_features_shape, axis=1)
+    def unroll(
+        self,
+        input: jax.Array,
+        state: ConvGRUNDState,
+        reverse: bool = False,
+    ) -> tuple[jax.Array, ConvGRUNDState]:
+        """Run the cell over a ``(time, in_features, *spatial)`` sequence.
+
+        The input convolution of all time steps is computed as a single batched
+        convolution before the scan, leaving only the recurrent convolution
+        inside the loop body.
+
+        Args:
+            input: the input sequence with shape ``(time, in_features, *spatial)``.
+            state: the initial state of the cell.
+            reverse: whether to scan the sequence in reverse order.
+
+        Returns:
+            The stacked outputs with shape ``(time, hidden_features, *spatial)``
+            and the final state.
+
+        Example:
+            >>> import serket as sk
+            >>> import jax.numpy as jnp
+            >>> import jax.random as jr
+            >>> cell = sk.nn.ConvGRU1DCell(10, 2, 3, key=jr.key(0))
+            >>> input = jnp.ones([5, 10, 4])
+            >>> state = sk.tree_state(cell, input=input[0])
+            >>> output, state = cell.unroll(input, state)
+            >>> output.shape
+            (5, 2, 4)
+        """
+        if not isinstance(state, ConvGRUNDState):
+            raise TypeError(f"Expected {state=} to be an instance of `GRUState`")
+
+        ih = jax.vmap(self.in_to_hidden)(input)
+
+        def step(state: ConvGRUNDState, ih: jax.Array):
+            h = state.hidden_state
+            hh = self.hidden_to_hidden(h)
+            h = gru_update(ih, hh, h, self.act, self.recurrent_act)
+            return ConvGRUNDState(h), h
+
+        state, output = jax.lax.scan(step, state, ih, reverse=reverse)
+        return output, state
+
     @property
     @abc.abstractmethod
     def conv_layer(self): ...
 
+    # optional, only required for ``separable=True``
+    separable_conv_layer = None
+
     spatial_ndim = property(abc.abstractmethod(lambda _: ...))
 
 
@@ -1062,6 +1444,8 @@ class ConvGRU1DCell(ConvGRUNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -1098,6 +1482,7 @@ class ConvGRU1DCell(ConvGRUNDCell):
 
     spatial_ndim: int = 1
     conv_layer = Conv1D
+    separable_conv_layer = SeparableConv1D
 
 
 class FFTConvGRU1DCell(ConvGRUNDCell):
@@ -1116,6 +1501,8 @@ class FFTConvGRU1DCell(ConvGRUNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -1152,6 +1539,7 @@ class FFTConvGRU1DCell(ConvGRUNDCell):
 
     spatial_ndim: int = 1
     conv_layer = FFTConv1D
+    separable_conv_layer = SeparableFFTConv1D
 
 
 class ConvGRU2DCell(ConvGRUNDCell):
@@ -1170,6 +1558,8 @@ class ConvGRU2DCell(ConvGRUNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -1206,6 +1596,7 @@ class ConvGRU2DCell(ConvGRUNDCell):
 
     spatial_ndim: int = 2
     conv_layer = Conv2D
+    separable_conv_layer = SeparableConv2D
 
 
 class FFTConvGRU2DCell(ConvGRUNDCell):
@@ -1224,6 +1615,8 @@ class FFTConvGRU2DCell(ConvGRUNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -1260,6 +1653,7 @@ class FFTConvGRU2DCell(ConvGRUNDCell):
 
     spatial_ndim: int = 2
     conv_layer = FFTConv2D
+    separable_conv_layer = SeparableFFTConv2D
 
 
 class ConvGRU3DCell(ConvGRUNDCell):
@@ -1278,6 +1672,8 @@ class ConvGRU3DCell(ConvGRUNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -1314,6 +1710,7 @@ class ConvGRU3DCell(ConvGRUNDCell):
 
     spatial_ndim: int = 3
     conv_layer = Conv3D
+    separable_conv_layer = SeparableConv3D
 
 
 class FFTConvGRU3DCell(ConvGRUNDCell):
@@ -1332,6 +1729,8 @@ class FFTConvGRU3DCell(ConvGRUNDCell):
         recurrent_weight_init: Recurrent weight initialization function
         act: Activation function
         recurrent_act: Recurrent activation function
+        separable: Whether to use a depthwise separable recurrent convolution.
+            ``False`` by default. Does not support ``dilation``.
         dtype: dtype of the weights and biases. ``float32``
 
     Example:
@@ -1368,6 +1767,7 @@ class FFTConvGRU3DCell(ConvGRUNDCell):
 
     spatial_ndim: int = 3
     conv_layer = FFTConv3D
+    separable_conv_layer = SeparableFFTConv3D
 
 
 def scan_cell(
@@ -1452,14 +1852,14 @@ def scan_cell(
         >>> npt.assert_allclose(output1, output2, atol=1e-6)
     """
 
-    def scan_func(state: S, input: jax.Array) -> tuple[S, jax.Array]:
-        output, state = cell(input, state)
-        return state, output
-
     def wrapper(input: jax.Array, state: S) -> tuple[jax.Array, S]:
         # push the scan axis to the front
         input = jnp.moveaxis(input, in_axis, 0)
-        state, output = jax.lax.scan(scan_func, state, input, reverse=reverse)
+        if has_unroll(cell):
+            # hoist the input projection out of the scan
+            output, state = cell.unroll(input, state, reverse=reverse)
+        else:
+            output, state = scan_steps(cell, input, state, reverse)
         # move the output axis to the desired location
         output = jnp.moveaxis(output, 0, out_axis)
         return output, state
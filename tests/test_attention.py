@@ -14,11 +14,14 @@
 
 from __future__ import annotations
 
+import jax
 import jax.numpy as jnp
 import jax.random as jr
+import numpy.testing as npt
 import pytest
 
 import serket as sk
+from serket._src.nn.attention import dot_product_attention, fused_dot_product_attention
 
 
 def test_attention_shape():
@@ -51,3 +54,101 @@ def test_attention_shape():
 
     with pytest.raises(ValueError):
         sk.nn.MultiHeadAttention(4, 4, 4, 4, 10, key=jr.key(0))
+
+
+def test_fused_attention_matches_reference():
+    q = jr.normal(jr.key(0), (2, 3, 5, 2, 4))
+    k = jr.normal(jr.key(1), (2, 3, 6, 2, 4))
+    v = jr.normal(jr.key(2), (2, 3, 6, 2, 4))
+    mask = jr.uniform(jr.key(3), (2, 1, 2, 5, 6)) > 0.5
+    logits = jnp.einsum("...qhd,...khd->...hqk", q, k) / jnp.sqrt(4)
+    logits = jnp.where(mask, logits, jnp.finfo(logits.dtype).min)
+    weight = jax.nn.softmax(logits)
+    reference = jnp.einsum("...hqk,...khd->...qhd", weight, v)
+    fused = fused_dot_product_attention(q, k, v, mask)
+    npt.assert_allclose(fused, reference, atol=1e-5)
+
+
+def test_unfused_attention_matches_reference():
+    # broadcast batch dimensions cannot use the fused kernel
+    q = jr.normal(jr.key(0), (2, 3, 5, 2, 4))
+    k = jr.normal(jr.key(1), (1, 3, 6, 2, 4))
+    v = jr.normal(jr.key(2), (1, 3, 6, 2, 4))
+    mask = jr.uniform(jr.key(3), (2, 1, 2, 5, 6)) > 0.5
+    logits = jnp.einsum("...qhd,...khd->...hqk", q, k) / jnp.sqrt(4)
+    logits = jnp.where(mask, logits, jnp.finfo(logits.dtype).min)
+    weight = jax.nn.softmax(logits)
+    reference = jnp.einsum("...hqk,...khd->...qhd", weight, v)
+    output = dot_product_attention(q, k, v, mask, lambda input: input)
+    npt.assert_allclose(output, reference, atol=1e-5)
+
+    # mixed query and key dtypes cannot use the fused kernel
+    output = dot_product_attention(
+        q.astype(jnp.bfloat16), k, v, mask, lambda input: input
+    )
+    npt.assert_allclose(output, reference, atol=5e-2)
+
+
+def test_unfused_attention_masked_row():
+    # large negative logits overflow float16 when the mask bias is added
+    q = jr.normal(jr.key(0), (2, 3, 2, 4), dtype=jnp.float16) * 8
+    k = jr.normal(jr.key(1), (1, 3, 2, 4), dtype=jnp.float16) * 8
+    v = jr.normal(jr.key(2), (1, 3, 2, 4), dtype=jnp.float16)
+    # fully masked query row gives uniform weights instead of nan
+    mask = jnp.ones((2, 2, 3, 3), dtype=bool).at[:, :, 0].set(False)
+    output = dot_product_attention(q, k, v, mask, lambda input: input)
+    assert not jnp.isnan(output).any()
+    expected = jnp.broadcast_to(v.astype(jnp.float32).mean(-3), (2, 2, 4))
+    npt.assert_allclose(output[:, 0], expected, atol=1e-2)
+
+
+def test_attention_compute_dtype():
+    q = jr.uniform(jr.key(0), (3, 4, 4))
+    layer = sk.nn.MultiHeadAttention(2, 4, key=jr.key(0))
+    mixed = layer.at["compute_dtype"].set(jnp.bfloat16)
+    output = mixed(q, q, q, key=jr.key(0))
+    assert output.dtype == jnp.float32
+    npt.assert_allclose(output, layer(q, q, q, key=jr.key(0)), atol=5e-2)
+
+
+def test_attention_skip_dropout():
+    q = jr.uniform(jr.key(0), (3, 4, 4))
+    layer = sk.nn.MultiHeadAttention(2, 4, drop_rate=0.5, key=jr.key(0))
+    # no key means no dropout
+    expected = sk.tree_eval(layer)(q, q, q)
+    npt.assert_allclose(layer(q, q, q), expected)
+    layer = layer.at["dropout"]["drop_rate"].set(0.0)
+    npt.assert_allclose(layer(q, q, q, key=jr.key(1)), expected)
+    # zero drop rate skips the random mask under ``jax.jit``
+    jaxpr = jax.make_jaxpr(jax.jit(lambda q, key: layer(q, q, q, key=key)))
+    assert "random_bits" not in str(jaxpr(q, jr.key(1)))
+
+
+def test_attention_custom_projection():
+    q = jr.uniform(jr.key(0), (3, 4, 4))
+    layer = sk.nn.MultiHeadAttention(2, 4, key=jr.key(0))
+    # non-``Linear`` projections are called instead of viewing their weights
+    identity = layer.at["out_projection"].set(sk.nn.Identity())
+    assert identity(q, q, q).shape == (3, 4, 4)
+
+    class ScaledLinear(sk.nn.Linear):
+        def __call__(self, input):
+            return super().__call__(input) * 2
+
+    scaled = layer.at["out_projection"].set(
+        ScaledLinear(4, 4, weight_init="ones", key=jr.key(0))
+    )
+    expected = layer.at["out_projection"].set(
+        sk.nn.Linear(4, 4, weight_init=lambda *_: jnp.full([4, 4], 2.0), key=jr.key(0))
+    )
+    npt.assert_allclose(scaled(q, q, q), expected(q, q, q), atol=1e-5)
+
+
+def test_attention_value_head_size():
+    q = jr.normal(jr.key(0), (5, 2, 4))
+    k = jr.normal(jr.key(1), (6, 2, 4))
+    v = jr.normal(jr.key(2), (6, 2, 8))
+    # different key and value head sizes cannot use the fused kernel
+    output = dot_product_attention(q, k, v, None, lambda input: input)
+    weight = jax.nn.softmax(jnp.einsum("qhd,khd->hqk", q, k) / jnp.sqrt(4))
+    npt.assert_allclose(output, jnp.einsum("hqk,khd->qhd", weight, v), atol=1e-5)
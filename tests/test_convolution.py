@@ -1942,3 +1942,16 @@ def test_spectral_conv_3d():
         ),
         atol=1e-6,
     )
+
+
+def test_separable_conv_pointwise_weight_init():
+    layer = sk.nn.SeparableConv1D(
+        2,
+        3,
+        3,
+        pointwise_weight_init="ones",
+        pointwise_bias_init=None,
+        key=jax.random.key(0),
+    )
+    npt.assert_allclose(layer.pointwise_weight, jnp.ones([3, 2, 1]))
+    assert layer.pointwise_bias is None
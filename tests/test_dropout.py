@@ -51,6 +51,14 @@ def test_random_cutout_2d():
     y = layer(x, key=jax.random.key(0))
     npt.assert_equal(y.shape, (1, 10, 10))
 
+    # non-overlapping cutouts: exactly two 3x3 patches are filled
+    layer = sk.nn.RandomCutout2D((3, 3), 2, fill_value=0)
+    y = layer(x, key=jax.random.key(0))
+    npt.assert_equal(int((y == 0).sum()), 18)
+    # the trailing row/column that does not fit a patch is never cut out
+    npt.assert_allclose(y[:, -1, :], 1)
+    npt.assert_allclose(y[:, :, -1], 1)
+
 
 def test_random_cutout_3d():
     layer = sk.nn.RandomCutout3D((3, 3, 3), 1)
@@ -21,6 +21,7 @@ import numpy.testing as npt
 import pytest
 
 import serket as sk
+from serket._src.image.filter import filter_2d, separable_filter_2d
 
 
 def test_AvgBlur2D():
@@ -45,6 +46,17 @@ def test_AvgBlur2D():
     npt.assert_allclose(y, z, atol=1e-5)
 
 
+def test_separable_filter_2d():
+    image = jr.uniform(jr.key(0), (9, 9))
+    for ky, kx in [(3, 3), (3, 7), (7, 7)]:
+        kernel_y = jr.uniform(jr.key(1), (ky,))
+        kernel_x = jr.uniform(jr.key(2), (kx,))
+        two_pass = filter_2d(filter_2d(image, kernel_x[None]), kernel_y[:, None])
+        npt.assert_allclose(
+            separable_filter_2d(image, kernel_y, kernel_x), two_pass, atol=1e-5
+        )
+
+
 def test_GaussBlur2D():
     layer = sk.image.GaussianBlur2D(kernel_size=3, sigma=1.0)
     x = jnp.ones([1, 5, 5])
@@ -72,6 +84,19 @@ def test_GaussBlur2D():
     npt.assert_allclose(layer(x), z, atol=1e-5)
 
 
+def test_non_square_gaussian_blur_2d():
+    x = jnp.zeros([1, 9, 9]).at[0, 4, 4].set(1.0)
+    kwargs = dict(kernel_size=(3, 5), sigma=(0.5, 2.0))
+    blur = sk.image.GaussianBlur2D(**kwargs)(x)
+    # kernel_size and sigma are (height, width)
+    assert jnp.count_nonzero(blur[0, 4]) == 5
+    assert jnp.count_nonzero(blur[0, :, 4]) == 3
+    npt.assert_allclose(sk.image.FFTGaussianBlur2D(**kwargs)(x), blur, atol=1e-5)
+
+    sharp = sk.image.UnsharpMask2D(**kwargs)(x)
+    npt.assert_allclose(sk.image.FFTUnsharpMask2D(**kwargs)(x), sharp, atol=1e-5)
+
+
 def test_horizontal_translate():
     x = jnp.arange(1, 26).reshape(1, 5, 5)
     layer = sk.image.HorizontalTranslate2D(2)
@@ -28,6 +28,9 @@ def test_embed():
     with pytest.raises(TypeError):
         table(jnp.array([9.0]))
 
+    table = sk.nn.Embedding(10, 3, key=jax.random.key(0), dtype=jnp.bfloat16)
+    assert table(x).dtype == jnp.bfloat16
+
 
 def test_identity():
     x = jnp.array([[1, 2, 3], [4, 5, 6]])
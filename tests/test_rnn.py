@@ -17,6 +17,7 @@ import os
 os.environ["KERAS_BACKEND"] = "jax"
 from itertools import product
 
+import jax
 import jax.numpy as jnp
 import jax.random as jr
 import keras
@@ -24,6 +25,7 @@ import numpy.testing as npt
 import pytest
 
 import serket as sk
+from serket._src.nn.recurrent import ConvLSTMNDCell
 
 
 def test_simple_rnn():
@@ -217,3 +219,123 @@ def test_dense_cell():
     output, _ = sk.nn.scan_cell(cell)(input, state)
     # 1x10 @ 10x10 => 1x10
     npt.assert_allclose(output[-1], jnp.ones([10]) * 10.0)
+
+
+@pytest.mark.parametrize(
+    "cell_type", [sk.nn.SimpleRNNCell, sk.nn.LSTMCell, sk.nn.GRUCell]
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_unroll(cell_type, reverse):
+    cell = cell_type(2, 3, key=jr.key(0))
+    input = jr.uniform(jr.key(1), (5, 2))
+    state = sk.tree_state(cell)
+    output, final = cell.unroll(input, state, reverse=reverse)
+    expected = jnp.zeros([5, 3])
+    for i in reversed(range(5)) if reverse else range(5):
+        out, state = cell(input[i], state)
+        expected = expected.at[i].set(out)
+    npt.assert_allclose(output, expected, atol=1e-6)
+    npt.assert_allclose(final.hidden_state, state.hidden_state, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "cell_type", [sk.nn.SimpleRNNCell, sk.nn.LSTMCell, sk.nn.GRUCell]
+)
+def test_low_precision_weights(cell_type):
+    half = cell_type(2, 3, key=jr.key(0), dtype=jnp.bfloat16)
+    leaves = [x for x in jax.tree_util.tree_leaves(half) if isinstance(x, jax.Array)]
+    assert all(leaf.dtype == jnp.bfloat16 for leaf in leaves)
+    # compare against the same bfloat16 weights in single precision
+    cell = jax.tree_util.tree_map(
+        lambda x: x.astype(jnp.float32) if isinstance(x, jax.Array) else x, half
+    )
+    input = jr.uniform(jr.key(1), (5, 2))
+    # the float32 state keeps the recurrence in single precision
+    output, _ = sk.nn.scan_cell(half)(input, sk.tree_state(cell))
+    assert output.dtype == jnp.float32
+    expected, _ = sk.nn.scan_cell(cell)(input, sk.tree_state(cell))
+    npt.assert_allclose(output, expected, atol=5e-2)
+
+
+@pytest.mark.parametrize("cell_type", [sk.nn.ConvLSTM1DCell, sk.nn.ConvGRU2DCell])
+def test_conv_unroll(cell_type):
+    cell = cell_type(2, 3, 3, key=jr.key(0))
+    input = jr.uniform(jr.key(1), (5, 2, *[4] * cell.spatial_ndim))
+    state = sk.tree_state(cell, input=input[0])
+    output, final = cell.unroll(input, state)
+    expected = []
+    for i in range(5):
+        out, state = cell(input[i], state)
+        expected.append(out)
+    npt.assert_allclose(output, jnp.stack(expected), atol=1e-5)
+    npt.assert_allclose(final.hidden_state, state.hidden_state, atol=1e-5)
+
+
+@pytest.mark.parametrize("cell_type", [sk.nn.ConvLSTM2DCell, sk.nn.FFTConvGRU1DCell])
+def test_separable_conv_cell(cell_type):
+    cell = cell_type(2, 3, 3, separable=True, key=jr.key(0))
+    assert cell.hidden_to_hidden.pointwise_bias is None
+    input = jr.uniform(jr.key(1), (5, 2, *[4] * cell.spatial_ndim))
+    output, _ = sk.nn.scan_cell(cell)(input, sk.tree_state(cell, input=input[0]))
+    assert output.shape == (5, 3, *[4] * cell.spatial_ndim)
+
+    with pytest.raises(ValueError):
+        cell_type(2, 3, 3, separable=True, dilation=2, key=jr.key(0))
+
+
+def test_conv_cell_without_separable_layer():
+    class CustomConvLSTM1DCell(ConvLSTMNDCell):
+        spatial_ndim: int = 1
+        conv_layer = sk.nn.Conv1D
+
+    CustomConvLSTM1DCell(2, 3, 3, key=jr.key(0))
+
+    with pytest.raises(ValueError):
+        CustomConvLSTM1DCell(2, 3, 3, separable=True, key=jr.key(0))
+
+
+def test_unroll_validation():
+    cell = sk.nn.SimpleRNNCell(2, 3, key=jr.key(0))
+    state = sk.tree_state(cell)
+    with pytest.raises(ValueError, match="in_features"):
+        cell.unroll(jnp.ones([5, 4]), state)
+    with pytest.raises(ValueError):
+        cell.unroll(jnp.ones([2]), state)
+
+
+def test_scan_cell_respects_call_override():
+    class ZeroInputLSTMCell(sk.nn.LSTMCell):
+        def __call__(self, input, state):
+            return super().__call__(jnp.zeros_like(input), state)
+
+    cell = ZeroInputLSTMCell(2, 3, key=jr.key(0))
+    input = jr.uniform(jr.key(1), (5, 2))
+    state = sk.tree_state(cell)
+    output, _ = sk.nn.scan_cell(cell)(input, state)
+    expected, _ = sk.nn.scan_cell(cell)(jnp.zeros_like(input), state)
+    npt.assert_allclose(output, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("cell_type", [sk.nn.SimpleRNNCell, sk.nn.LSTMCell])
+def test_scan_cell_respects_replaced_projection(cell_type):
+    class ScaledLinear(sk.nn.Linear):
+        def __call__(self, input):
+            return super().__call__(input) * 2
+
+    cell = cell_type(2, 3, key=jr.key(0))
+    layer = ScaledLinear(5, cell.in_hidden_to_hidden.out_features, key=jr.key(2))
+    cell = cell.at["in_hidden_to_hidden"].set(layer)
+    input = jr.uniform(jr.key(1), (5, 2))
+    state = sk.tree_state(cell)
+    output, _ = sk.nn.scan_cell(cell)(input, state)
+    expected = []
+    for i in range(5):
+        out, state = cell(input[i], state)
+        expected.append(out)
+    npt.assert_allclose(output, jnp.stack(expected), atol=1e-6)
+
+def test_conv_cell_validation():
+    cell = sk.nn.ConvGRU1DCell(2, 3, 3, key=jr.key(0))
+    state = sk.tree_state(cell, input=jnp.ones([2, 4]))
+    with pytest.raises(ValueError, match="in_features"):
+        cell.unroll(jnp.ones([5, 4, 4]), state)